@@ -41,6 +41,8 @@ MARKET_SCORE_BULLISH_NORMAL_VOL = 3
 MARKET_SCORE_BEARISH_HIGH_VOL = -5
 VOLATILITY_SCORE_LOW = 3
 VOLATILITY_SCORE_HIGH = -3
+RECOMMENDED_DELTA_RANGE = (0.25, 0.75)
+RECOMMENDED_DTE_RANGE = (14, 45)
 
 # === RISK MANAGEMENT CONSTANTS ===
 DEFAULT_WIN_RATE_THRESHOLD = 0.6
@@ -48,6 +50,7 @@ DEFAULT_VOLATILITY_FACTOR_THRESHOLD = 0.3
 DEFAULT_MAX_CONSECUTIVE_LOSSES = 3
 DEFAULT_VOLATILITY_LOOKBACK = 20
 DEFAULT_VOLATILITY_THRESHOLD = 0.4
+MAX_LOSS_WORST_CASE_PRICE_FACTOR = 0.5
 
 # === TRADING CONSTANTS ===
 OPTION_CONTRACT_MULTIPLIER = 100
@@ -0,0 +1,122 @@
+"""
+Numeric Kernels
+
+This module contains the small array kernels behind the per-bar market
+analysis, the P&L volatility checks used for position sizing and the
+end-of-backtest Sharpe ratio. They are compiled with Numba when it is
+installed (it is available on QuantConnect). Without Numba the vectorized
+kernels run as plain NumPy and the loop kernels are swapped for equivalent
+NumPy reductions, so callers never need to care which one they get.
+
+All kernels expect a contiguous float64 NumPy array, oldest value first.
+Their signatures are declared up front so Numba compiles them eagerly at
+import (or loads them from its on-disk cache) instead of on first call.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+@njit("float64(float64[::1], int64)", cache=True)
+def moving_average_kernel(prices: np.ndarray, period: int) -> float:
+    """Simple moving average of the last `period` prices."""
+    # A single reduction over the tail slice; for windows this short NumPy's
+    # own mean beats an explicit loop when Numba is not available
+    return prices[-period:].mean()
+
+
+@njit("UniTuple(float64, 2)(float64[::1], int64)", cache=True)
+def volatility_kernel(prices: np.ndarray, window: int) -> Tuple[float, float]:
+    """
+    Annualized volatility of log returns.
+
+    Returns:
+        Tuple of (volatility over the last `window` returns, volatility over all returns)
+    """
+    returns = np.diff(np.log(prices))
+    annualization = np.sqrt(TRADING_DAYS_PER_YEAR)
+    current_vol = np.std(returns[-window:]) * annualization
+    historical_vol = np.std(returns) * annualization
+    return current_vol, historical_vol
+
+
+@njit("float64(float64[::1])", cache=True)
+def std_kernel(values: np.ndarray) -> float:
+    """Population standard deviation (same as np.std) via Welford's single pass."""
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for x in values:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+    if n == 0:
+        return np.nan
+    return np.sqrt(m2 / n)
+
+
+@njit("float64(float64[::1])", cache=True)
+def sharpe_kernel(pnl: np.ndarray) -> float:
+    """
+    Per-period Sharpe ratio of a P&L series: mean over std of its differences.
+
+    Returns nan when there are fewer than two values or the differences have
+    zero spread, so callers can skip reporting it.
+    """
+    mean = 0.0
+    m2 = 0.0
+    n = 0
+    for i in range(1, pnl.shape[0]):
+        n += 1
+        delta = (pnl[i] - pnl[i - 1]) - mean
+        mean += delta / n
+        m2 += delta * ((pnl[i] - pnl[i - 1]) - mean)
+    if n == 0 or m2 <= 0.0:
+        return np.nan
+    return mean / np.sqrt(m2 / n)
+
+
+def _numpy_std(values: np.ndarray) -> float:
+    """NumPy equivalent of std_kernel."""
+    if values.shape[0] == 0:
+        return np.nan
+    return float(np.std(values))
+
+
+def _numpy_sharpe(pnl: np.ndarray) -> float:
+    """NumPy equivalent of sharpe_kernel."""
+    returns = np.diff(pnl)
+    if returns.shape[0] == 0:
+        return np.nan
+    std = np.std(returns)
+    if std <= 0.0:
+        return np.nan
+    return float(np.mean(returns) / std)
+
+
+if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only without numba
+    # Uncompiled, the Welford loops above iterate over NumPy scalars in
+    # Python, several times slower than NumPy's own reductions
+    std_kernel = _numpy_std
+    sharpe_kernel = _numpy_sharpe
@@ -8,6 +8,8 @@ across different strategies and risk management components.
 import numpy as np
 from typing import List, Dict, Any, Tuple
 from .technical_indicators import PerformanceMetrics
+from .numeric_kernels import std_kernel
+from .constants import MAX_LOSS_WORST_CASE_PRICE_FACTOR, OPTION_CONTRACT_MULTIPLIER
 
 
 class PositionUtil:
@@ -48,13 +50,24 @@ class PositionUtil:
     def calculate_max_loss(contract: Any, underlying_price: float) -> float:
         """Calculate maximum potential loss for a short put position."""
         # Use a realistic worst-case scenario: 50% drop in underlying price
-        worst_case_price = underlying_price * 0.5
+        worst_case_price = underlying_price * MAX_LOSS_WORST_CASE_PRICE_FACTOR
 
         # Calculate intrinsic value at worst-case price
         intrinsic_value = max(0, contract.Strike - worst_case_price)
 
-        # Loss per contract = intrinsic value * 100 (contract multiplier)
-        return intrinsic_value * 100
+        # Loss per contract = intrinsic value * contract multiplier
+        return intrinsic_value * OPTION_CONTRACT_MULTIPLIER
+
+    @staticmethod
+    def calculate_max_loss_batch(
+        strikes: np.ndarray, underlying_price: float
+    ) -> np.ndarray:
+        """Calculate the maximum short put loss for an array of strikes."""
+        worst_case_price = underlying_price * MAX_LOSS_WORST_CASE_PRICE_FACTOR
+        strikes = np.asarray(strikes, dtype=np.float64)
+        return (
+            np.maximum(0.0, strikes - worst_case_price) * OPTION_CONTRACT_MULTIPLIER
+        )
 
     @staticmethod
     def calculate_margin_based_size(contract: Any, available_margin: float) -> int:
@@ -80,8 +93,8 @@ class PositionUtil:
         if len(daily_pnl) < lookback:
             return 1.0  # Default factor when insufficient data
 
-        recent_pnl = daily_pnl[-lookback:]
-        volatility = float(np.std(recent_pnl))
+        recent_pnl = np.asarray(daily_pnl[-lookback:], dtype=np.float64)
+        volatility = std_kernel(recent_pnl)
 
         # Adjust position size based on volatility regime
         if volatility > threshold:
@@ -104,9 +117,7 @@ class PositionUtil:
     ) -> int:
         """Calculate optimal position size using multiple methods."""
         # Step 1: Calculate Kelly Criterion
-        win_rate = PerformanceMetrics.calculate_win_rate(trades)
-        avg_win = PerformanceMetrics.calculate_average_win(trades)
-        avg_loss = PerformanceMetrics.calculate_average_loss(trades)
+        win_rate, avg_win, avg_loss = PerformanceMetrics.calculate_trade_stats(trades)
 
         kelly_fraction = PositionUtil.calculate_kelly_criterion(
             win_rate, avg_win, avg_loss
@@ -178,7 +189,7 @@ class RiskLimits:
         if len(daily_pnl) < min_data_points:
             return False
 
-        volatility = float(np.std(daily_pnl))
+        volatility = std_kernel(np.asarray(daily_pnl, dtype=np.float64))
         max_volatility = portfolio_value * max_volatility_pct
         return volatility > max_volatility
 
@@ -223,6 +223,30 @@ class PerformanceMetrics:
             return 200  # Default assumption
         return abs(float(np.mean([t["pnl"] for t in completed_trades])))
 
+    @staticmethod
+    def calculate_trade_stats(
+        trades: List[Dict[str, Any]]
+    ) -> Tuple[float, float, float]:
+        """
+        Calculate win rate, average win and average loss in one pass over trades.
+
+        Returns the same values (and defaults) as calculate_win_rate,
+        calculate_average_win and calculate_average_loss.
+        """
+        pnl = np.fromiter(
+            (t["pnl"] for t in trades if "pnl" in t), dtype=np.float64
+        )
+        if pnl.size == 0:
+            return 0.6, 100, 200  # Default assumptions
+
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+
+        win_rate = wins.size / pnl.size
+        avg_win = float(wins.mean()) if wins.size else 100
+        avg_loss = abs(float(losses.mean())) if losses.size else 200
+        return win_rate, avg_win, avg_loss
+
     @staticmethod
     def calculate_drawdown(peak_value: float, current_value: float) -> float:
         """Calculate drawdown percentage."""
@@ -447,26 +447,25 @@ class CriteriaManager:
         if validation_errors:
             return False, 0.0, f"Context validation failed: {', '.join(validation_errors)}"
         
-        evaluations = self.evaluate_all(context)
-        
-        # Check if any criteria failed
-        failed_criteria = [name for name, eval in evaluations.items() 
-                          if eval.result == CriteriaResult.FAIL]
-        
-        if failed_criteria:
-            failed_messages = [evaluations[name].message for name in failed_criteria]
-            return False, 0.0, f"Trade blocked by: {', '.join(failed_messages)}"
+        # Evaluate criteria in order, stopping at the first failure: any FAIL
+        # blocks the trade with a score of 0 whatever the remaining criteria say
+        evaluations = []
+        for criterion in self.criteria:
+            evaluation = criterion.evaluate(context)
+            if evaluation.result == CriteriaResult.FAIL:
+                return False, 0.0, f"Trade blocked by: {evaluation.message}"
+            evaluations.append((criterion, evaluation))
         
         # Calculate weighted score
         total_weight = sum(c.weight for c in self.criteria)
         weighted_score = sum(
-            evaluations[c.name].score * c.weight 
-            for c in self.criteria
+            evaluation.score * criterion.weight 
+            for criterion, evaluation in evaluations
         ) / total_weight if total_weight > 0 else 0.0
         
         # Generate summary
-        passed_criteria = [name for name, eval in evaluations.items() 
-                          if eval.result == CriteriaResult.PASS]
+        passed_criteria = [criterion.name for criterion, evaluation in evaluations 
+                          if evaluation.result == CriteriaResult.PASS]
         summary = f"Trade allowed by {len(passed_criteria)} criteria with score {weighted_score:.3f}"
         
         return True, weighted_score, summary
@@ -3,6 +3,7 @@ from AlgorithmImports import *
 import numpy as np
 from typing import Optional, TYPE_CHECKING
 from dataclasses import dataclass
+from shared.utils.numeric_kernels import sharpe_kernel
 
 if TYPE_CHECKING:
     from ..sell_put_strategy import SellPutOptionStrategy
@@ -122,9 +123,10 @@ class Evaluator:
                                 all_daily_pnl.extend(stock_manager.daily_pnl)
 
                         if all_daily_pnl and len(all_daily_pnl) > 1:
-                            returns = np.diff(all_daily_pnl)
-                            if len(returns) > 0 and np.std(returns) > 0:
-                                sharpe_ratio = np.mean(returns) / np.std(returns)
+                            sharpe_ratio = sharpe_kernel(
+                                np.asarray(all_daily_pnl, dtype=np.float64)
+                            )
+                            if not np.isnan(sharpe_ratio):
                                 self.strategy.Log(f"Sharpe Ratio: {sharpe_ratio:.2f}")
                     except Exception as e:
                         self.strategy.Log(f"Could not calculate Sharpe ratio: {str(e)}")
@@ -1,7 +1,9 @@
 from AlgorithmImports import *  # type: ignore
-from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 import numpy as np
+from shared.utils.constants import RECOMMENDED_DELTA_RANGE, RECOMMENDED_DTE_RANGE
 from shared.utils.market_analysis_types import (
     MarketAnalysis,
     MarketRegime,
@@ -9,6 +11,7 @@ from shared.utils.market_analysis_types import (
     VolatilityData,
     SupportResistanceData,
 )
+from shared.utils.numeric_kernels import moving_average_kernel, volatility_kernel
 from shared.utils.trading_criteria import (
     CriteriaManager,
     CriteriaPresets,
@@ -24,6 +27,16 @@ from shared.utils.trading_criteria import (
 if TYPE_CHECKING:
     from ..sell_put_strategy import SellPutOptionStrategy
 
+VOLATILITY_HISTORY_LENGTH = 50
+SUPPORT_RESISTANCE_WINDOW = 20
+
+# (trend direction, volatility regime) -> market regime
+_MARKET_REGIMES: Dict[Tuple[str, str], MarketRegime] = {
+    (trend, vol_regime): MarketRegime(f"{trend}_{vol_regime}_vol")
+    for trend in ("bullish", "bearish", "neutral")
+    for vol_regime in ("low", "normal", "high")
+}
+
 
 @dataclass
 class MarketAnalyzer:
@@ -46,15 +59,49 @@ class MarketAnalyzer:
     rsi_period: int = 14
     moving_average_period: int = 50
 
-    # Data storage
-    price_history: List[float] = field(default_factory=list)
-    volatility_history: List[float] = field(default_factory=list)
+    # Data storage (bounded to the last VOLATILITY_HISTORY_LENGTH samples)
+    volatility_history: Deque[float] = field(default_factory=deque)
+
+    # Price ring buffer (see update_price_history / price_history)
+    _price_buffer: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _price_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Running RSI state over the last rsi_period price changes
+    _rsi_gains: Deque[float] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _rsi_losses: Deque[float] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _rsi_gain_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _rsi_loss_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _rsi_loss_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Monotonic (index, price) deques over the support/resistance window;
+    # the front of each holds the window's high and low respectively
+    _window_highs: Deque[Tuple[int, float]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _window_lows: Deque[Tuple[int, float]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
 
     # Criteria manager
     criteria_manager: Optional[CriteriaManager] = field(default=None, init=False)
 
     def __post_init__(self):
-        """Initialize the criteria manager with default criteria."""
+        """Initialize the price buffer and the criteria manager with default criteria."""
+        self.volatility_history = deque(
+            self.volatility_history, maxlen=VOLATILITY_HISTORY_LENGTH
+        )
+
+        # Every price is written twice (slot and slot + lookback) so the most
+        # recent window is always a contiguous slice of the buffer
+        self._price_buffer = np.empty(2 * self.volatility_lookback, dtype=np.float64)
+        self._reset_rsi_state()
+
         # Start with delta-only criteria (can be customized later)
         self.criteria_manager = CriteriaPresets.delta_only()
 
@@ -138,7 +185,7 @@ class MarketAnalyzer:
         This method can be customized based on the criteria manager.
         """
         # For now, return fixed range - can be made dynamic based on criteria
-        return (0.25, 0.75)
+        return RECOMMENDED_DELTA_RANGE
 
     def get_optimal_dte_range(self, volatility_data: VolatilityData) -> Tuple[int, int]:
         """
@@ -147,23 +194,107 @@ class MarketAnalyzer:
         This method can be customized based on the criteria manager.
         """
         # For now, return fixed range - can be made dynamic based on criteria
-        return (14, 45)
+        return RECOMMENDED_DTE_RANGE
+
+    @property
+    def price_history(self) -> np.ndarray:
+        """
+        Most recent prices (at most volatility_lookback), oldest first.
+
+        This is a view into the ring buffer, so it is only valid until the
+        next call to update_price_history.
+        """
+        if self._price_count < self.volatility_lookback:
+            return self._price_buffer[: self._price_count]
+        start = self._price_count % self.volatility_lookback
+        return self._price_buffer[start : start + self.volatility_lookback]
 
     def update_price_history(self, price: float) -> None:
         """Update price history for analysis."""
-        self.price_history.append(price)
-        if len(self.price_history) > self.volatility_lookback:
-            self.price_history.pop(0)
+        if self._price_count:
+            last_slot = (self._price_count - 1) % self.volatility_lookback
+            self._push_rsi_change(float(price - self._price_buffer[last_slot]))
+
+        slot = self._price_count % self.volatility_lookback
+        self._price_buffer[slot] = price
+        self._price_buffer[slot + self.volatility_lookback] = price
+        self._push_window_extremes(self._price_count, float(price))
+        self._price_count += 1
+
+    def load_price_history(self, prices: np.ndarray) -> None:
+        """
+        Replace the price history with a series of prices, oldest first.
+
+        Leaves the analyzer in the same state as calling update_price_history
+        for each price in turn, without the per-price Python overhead.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        total = len(prices)
+        window = prices[-self.volatility_lookback :]
+
+        slots = np.arange(total - len(window), total) % self.volatility_lookback
+        self._price_buffer[slots] = window
+        self._price_buffer[slots + self.volatility_lookback] = window
+        self._price_count = total
+
+        self._reset_rsi_state()
+        for change in np.diff(prices[-(self.rsi_period + 1) :]):
+            self._push_rsi_change(float(change))
+
+        self._window_highs.clear()
+        self._window_lows.clear()
+        for index in range(max(0, total - SUPPORT_RESISTANCE_WINDOW), total):
+            self._push_window_extremes(index, float(prices[index]))
+
+    def _push_window_extremes(self, index: int, price: float) -> None:
+        """Add a price to the high/low deques and expire entries outside the window."""
+        while self._window_highs and self._window_highs[-1][1] <= price:
+            self._window_highs.pop()
+        self._window_highs.append((index, price))
+        if self._window_highs[0][0] <= index - SUPPORT_RESISTANCE_WINDOW:
+            self._window_highs.popleft()
+
+        while self._window_lows and self._window_lows[-1][1] >= price:
+            self._window_lows.pop()
+        self._window_lows.append((index, price))
+        if self._window_lows[0][0] <= index - SUPPORT_RESISTANCE_WINDOW:
+            self._window_lows.popleft()
+
+    def _reset_rsi_state(self) -> None:
+        """Clear the running RSI sums."""
+        self._rsi_gains = deque(maxlen=self.rsi_period)
+        self._rsi_losses = deque(maxlen=self.rsi_period)
+        self._rsi_gain_sum = 0.0
+        self._rsi_loss_sum = 0.0
+        self._rsi_loss_count = 0
+
+    def _push_rsi_change(self, change: float) -> None:
+        """Add one price change to the RSI window, dropping the oldest if full."""
+        if len(self._rsi_gains) == self.rsi_period:
+            self._rsi_gain_sum -= self._rsi_gains[0]
+            self._rsi_loss_sum -= self._rsi_losses[0]
+            if self._rsi_losses[0] > 0:
+                self._rsi_loss_count -= 1
+
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        self._rsi_gains.append(gain)
+        self._rsi_losses.append(loss)
+        self._rsi_gain_sum += gain
+        self._rsi_loss_sum += loss
+        if loss > 0:
+            self._rsi_loss_count += 1
 
     def _analyze_trend(self) -> TrendData:
         """Analyze price trend."""
-        if len(self.price_history) < self.moving_average_period:
+        prices = self.price_history
+        if len(prices) < self.moving_average_period:
             return TrendData(
                 direction="neutral", strength=0.5, duration_days=0, is_strong=False
             )
 
-        current_price = self.price_history[-1]
-        ma = float(np.mean(self.price_history[-self.moving_average_period :]))
+        current_price = prices[-1]
+        ma = moving_average_kernel(prices, self.moving_average_period)
 
         if current_price > ma * 1.02:
             direction = "bullish"
@@ -178,24 +309,21 @@ class MarketAnalyzer:
         return TrendData(
             direction=direction,
             strength=strength,
-            duration_days=min(30, len(self.price_history)),
+            duration_days=min(30, len(prices)),
             is_strong=is_strong,
         )
 
     def _analyze_volatility(self) -> VolatilityData:
         """Analyze price volatility."""
-        if len(self.price_history) < 10:
+        prices = self.price_history
+        if len(prices) < 10:
             return VolatilityData(
                 current=0.2, historical_vol=0.2, percentile=0.5, regime="normal"
             )
 
-        returns = np.diff(np.log(self.price_history))
-        current_vol = np.std(returns[-5:]) * np.sqrt(252)
-        historical_vol = np.std(returns) * np.sqrt(252)
+        current_vol, historical_vol = volatility_kernel(prices, 5)
 
         self.volatility_history.append(current_vol)
-        if len(self.volatility_history) > 50:
-            self.volatility_history.pop(0)
 
         percentile = (
             sum(1 for v in self.volatility_history if v < current_vol)
@@ -220,7 +348,8 @@ class MarketAnalyzer:
 
     def _analyze_support_resistance(self) -> SupportResistanceData:
         """Analyze support and resistance levels."""
-        if len(self.price_history) < 20:
+        prices = self.price_history
+        if len(prices) < SUPPORT_RESISTANCE_WINDOW:
             return SupportResistanceData(
                 support_level=0,
                 resistance_level=float("inf"),
@@ -230,9 +359,9 @@ class MarketAnalyzer:
                 is_near_resistance=False,
             )
 
-        recent_high = max(self.price_history[-20:])
-        recent_low = min(self.price_history[-20:])
-        current_price = self.price_history[-1]
+        recent_high = self._window_highs[0][1]
+        recent_low = self._window_lows[0][1]
+        current_price = float(prices[-1])
 
         distance_to_resistance = (recent_high - current_price) / current_price
         distance_to_support = (current_price - recent_low) / current_price
@@ -251,60 +380,27 @@ class MarketAnalyzer:
     ) -> MarketRegime:
         """Determine market regime."""
         trend = trend_data.direction
+        if trend not in ("bullish", "bearish"):
+            trend = "neutral"
         vol_regime = volatility_data.regime
+        if vol_regime not in ("low", "high"):
+            vol_regime = "normal"
 
-        if trend == "bullish":
-            if vol_regime == "low":
-                return MarketRegime.BULLISH_LOW_VOL
-            elif vol_regime == "high":
-                return MarketRegime.BULLISH_HIGH_VOL
-            else:
-                return MarketRegime.BULLISH_NORMAL_VOL
-        elif trend == "bearish":
-            if vol_regime == "low":
-                return MarketRegime.BEARISH_LOW_VOL
-            elif vol_regime == "high":
-                return MarketRegime.BEARISH_HIGH_VOL
-            else:
-                return MarketRegime.BEARISH_NORMAL_VOL
-        else:
-            if vol_regime == "low":
-                return MarketRegime.NEUTRAL_LOW_VOL
-            elif vol_regime == "high":
-                return MarketRegime.NEUTRAL_HIGH_VOL
-            else:
-                return MarketRegime.NEUTRAL_NORMAL_VOL
+        return _MARKET_REGIMES[(trend, vol_regime)]
 
     def _calculate_rsi(self) -> float:
-        """Calculate RSI momentum indicator."""
+        """Calculate RSI momentum indicator from the running gain/loss sums."""
         if len(self.price_history) < self.rsi_period + 1:
             return 50.0
 
-        gains = []
-        losses = []
-
-        for i in range(1, len(self.price_history)):
-            change = self.price_history[i] - self.price_history[i - 1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        if len(gains) < self.rsi_period:
-            return 50.0
-
-        avg_gain = float(np.mean(gains[-self.rsi_period :]))
-        avg_loss = float(np.mean(losses[-self.rsi_period :]))
-
-        if avg_loss == 0:
+        # Counted separately so an all-gains window is exact despite the
+        # rounding the running sums pick up
+        if self._rsi_loss_count == 0:
             return 100.0
 
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
+        # Both averages share the same divisor, so the ratio of sums is the RS
+        rs = max(0.0, self._rsi_gain_sum) / self._rsi_loss_sum
+        return 100.0 - 100.0 / (1.0 + rs)
 
     def _calculate_risk_score(
         self, trend_data: TrendData, volatility_data: VolatilityData
@@ -361,8 +457,8 @@ class MarketAnalyzer:
             risk_score=0.5,
             confidence_score=0.3,
             should_trade=False,
-            recommended_delta_range=(0.25, 0.75),
-            recommended_dte_range=(14, 45),
+            recommended_delta_range=RECOMMENDED_DELTA_RANGE,
+            recommended_dte_range=RECOMMENDED_DTE_RANGE,
             analysis_timestamp=None,
             data_quality_score=0.3,
         )
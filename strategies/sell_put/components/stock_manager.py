@@ -1,6 +1,7 @@
 from AlgorithmImports import *  # type: ignore
+from collections import deque
 from datetime import date
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Iterable, List, Optional, Any
 from dataclasses import dataclass, field
 from shared.utils.constants import (
     DEFAULT_TARGET_DELTA_MIN,
@@ -51,11 +52,15 @@ class StockManager:
     trade_count: int = field(default=0, init=False)
     profit_loss: float = field(default=0.0, init=False)
     trades: List[Dict[str, Any]] = field(default_factory=list, init=False)
-    daily_pnl: List[float] = field(default_factory=list, init=False)
+    daily_pnl: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=MAX_PNL_HISTORY_LENGTH), init=False
+    )
     peak_portfolio_value: float = field(default=0.0, init=False)
 
-    # Stock-specific data storage
-    price_history: List[float] = field(default_factory=list, init=False)
+    # Stock-specific data storage (bounded deques drop the oldest entry in O(1))
+    price_history: Deque[float] = field(
+        default_factory=lambda: deque(maxlen=MAX_PRICE_HISTORY_LENGTH), init=False
+    )
     volatility_history: List[float] = field(default_factory=list, init=False)
     returns_history: List[float] = field(default_factory=list, init=False)
 
@@ -173,11 +178,18 @@ class StockManager:
 
     def _update_price_history(self, price: float) -> None:
         """Update stock-specific price history."""
+        # The deque keeps only the last MAX_PRICE_HISTORY_LENGTH prices
         self.price_history.append(price)
 
-        # Keep only recent prices to avoid memory issues
-        if len(self.price_history) > MAX_PRICE_HISTORY_LENGTH:
-            self.price_history.pop(0)
+    def extend_price_history(self, prices: Iterable[float]) -> None:
+        """
+        Append a batch of prices (e.g. a history request), oldest first.
+
+        Args:
+            prices: Prices to append; only the last MAX_PRICE_HISTORY_LENGTH
+                are kept
+        """
+        self.price_history.extend(prices)
 
     def should_trade(self) -> bool:
         """
@@ -327,8 +339,5 @@ class StockManager:
             pnl: Profit/loss for the current period
         """
         self.profit_loss += pnl
+        # The deque keeps only the last MAX_PNL_HISTORY_LENGTH entries
         self.daily_pnl.append(pnl)
-
-        # Keep only recent PnL data
-        if len(self.daily_pnl) > MAX_PNL_HISTORY_LENGTH:
-            self.daily_pnl.pop(0)
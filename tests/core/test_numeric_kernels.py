@@ -0,0 +1,66 @@
+"""
+Tests for the compiled numeric kernels.
+"""
+
+import numpy as np
+import pytest
+
+from shared.utils.numeric_kernels import (
+    _numpy_sharpe,
+    _numpy_std,
+    sharpe_kernel,
+    std_kernel,
+)
+
+
+# Each kernel alongside the NumPy fallback used when Numba is missing
+@pytest.fixture(params=[std_kernel, _numpy_std], ids=["kernel", "numpy"])
+def std_impl(request):
+    return request.param
+
+
+@pytest.fixture(params=[sharpe_kernel, _numpy_sharpe], ids=["kernel", "numpy"])
+def sharpe_impl(request):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1000.0, 1100.0, 1050.0, 1150.0, 1080.0] * 4,
+        [1000.0, -2000.0, 1500.0, -3000.0, 800.0] * 4,
+        [1e9 + 1.0, 1e9 + 2.0, 1e9 + 3.0],
+        [42.0],
+    ],
+    ids=["low_vol", "high_vol", "large_offset", "single"],
+)
+def test_std_kernel_matches_numpy(std_impl, values):
+    """Test that the Welford kernel agrees with np.std (ddof=0)."""
+    values = np.asarray(values, dtype=np.float64)
+    assert std_impl(values) == pytest.approx(np.std(values), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "pnl",
+    [
+        [1000.0, 1100.0, 1050.0, 1150.0, 1080.0] * 4,
+        [1000.0, -2000.0, 1500.0, -3000.0, 800.0] * 4,
+    ],
+    ids=["low_vol", "high_vol"],
+)
+def test_sharpe_kernel_matches_numpy(sharpe_impl, pnl):
+    """Test that the Sharpe kernel agrees with mean/std of np.diff."""
+    pnl = np.asarray(pnl, dtype=np.float64)
+    returns = np.diff(pnl)
+    expected = np.mean(returns) / np.std(returns)
+    assert sharpe_impl(pnl) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    "pnl",
+    [[], [100.0], [100.0, 200.0], [100.0, 200.0, 300.0]],
+    ids=["empty", "single", "one_return", "constant_returns"],
+)
+def test_sharpe_kernel_undefined(sharpe_impl, pnl):
+    """Test that the Sharpe kernel returns nan when the spread is zero."""
+    assert np.isnan(sharpe_impl(np.asarray(pnl, dtype=np.float64)))
@@ -0,0 +1,32 @@
+"""
+Benchmarks for the position sizing hot path.
+
+Skipped unless pytest-benchmark is installed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from shared.utils.position_utils import PositionUtil
+
+pytest.importorskip("pytest_benchmark")
+
+
+CONTRACT_150 = SimpleNamespace(Strike=150.0)
+TRADES = [{"pnl": pnl} for pnl in (500.0, -200.0, 300.0, -400.0, 250.0)] * 20
+DAILY_PNL = [1000.0, 1100.0, 1050.0, 1150.0, 1080.0] * 20
+
+
+def test_bench_optimal_position_size(benchmark):
+    """Benchmark a full position sizing decision."""
+    size = benchmark(
+        PositionUtil.calculate_optimal_position_size,
+        CONTRACT_150,
+        160.0,
+        100000.0,
+        50000.0,
+        TRADES,
+        DAILY_PNL,
+    )
+    assert size >= 1
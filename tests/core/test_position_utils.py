@@ -0,0 +1,112 @@
+"""
+Tests for the position sizing and trade statistics utilities.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from shared.utils.position_utils import PositionUtil, RiskLimits
+from shared.utils.technical_indicators import PerformanceMetrics
+
+
+TRADES = [
+    {"pnl": 500.0},
+    {"pnl": -200.0},
+    {"pnl": 300.0},
+    {"pnl": 0.0},
+    {"pnl": -400.0},
+    {"symbol": "AAPL"},  # Still open, no pnl yet
+]
+
+LOW_VOL_PNL = [1000.0, 1100.0, 1050.0, 1150.0, 1080.0] * 4
+HIGH_VOL_PNL = [1000.0, -2000.0, 1500.0, -3000.0, 800.0] * 4
+
+
+class TestTradeStats:
+    """Test the single-pass trade statistics."""
+
+    @pytest.mark.parametrize(
+        "trades",
+        [
+            TRADES,
+            [],
+            [{"symbol": "AAPL"}],
+            [{"pnl": 250.0}, {"pnl": 150.0}],
+            [{"pnl": -250.0}, {"pnl": -150.0}],
+        ],
+        ids=["mixed", "empty", "open_only", "all_wins", "all_losses"],
+    )
+    def test_matches_individual_metrics(self, trades):
+        """Test that the combined pass agrees with the per-metric helpers."""
+        win_rate, avg_win, avg_loss = PerformanceMetrics.calculate_trade_stats(trades)
+
+        assert win_rate == pytest.approx(PerformanceMetrics.calculate_win_rate(trades))
+        assert avg_win == pytest.approx(
+            PerformanceMetrics.calculate_average_win(trades)
+        )
+        assert avg_loss == pytest.approx(
+            PerformanceMetrics.calculate_average_loss(trades)
+        )
+
+    def test_mixed_trades(self):
+        """Test the statistics for a known set of trades."""
+        win_rate, avg_win, avg_loss = PerformanceMetrics.calculate_trade_stats(TRADES)
+
+        assert win_rate == pytest.approx(2 / 5)
+        assert avg_win == pytest.approx(400.0)
+        assert avg_loss == pytest.approx(300.0)
+
+
+class TestMaxLoss:
+    """Test the short put max-loss calculation."""
+
+    def test_batch_matches_single_contract(self):
+        """Test that the batch version agrees with the per-contract version."""
+        strikes = np.array([0.0, 50.0, 80.0, 150.0, 160.0])
+        underlying_price = 160.0
+
+        expected = [
+            PositionUtil.calculate_max_loss(
+                SimpleNamespace(Strike=strike), underlying_price
+            )
+            for strike in strikes
+        ]
+
+        np.testing.assert_allclose(
+            PositionUtil.calculate_max_loss_batch(strikes, underlying_price),
+            expected,
+        )
+
+
+class TestShouldStopTrading:
+    """Test the combined trading circuit breaker."""
+
+    @pytest.mark.parametrize(
+        "current_value,peak_value,trades,daily_pnl,expected",
+        [
+            (85000.0, 100000.0, [], [], True),
+            (95000.0, 100000.0, [], [], False),
+            (95000.0, 100000.0, [{"pnl": -1000.0}] * 4, [], True),
+            (95000.0, 100000.0, [], HIGH_VOL_PNL, True),
+            (95000.0, 100000.0, [], LOW_VOL_PNL, False),
+        ],
+        ids=["drawdown", "ok", "losses", "volatility", "calm_pnl"],
+    )
+    def test_should_stop_trading(
+        self, current_value, peak_value, trades, daily_pnl, expected
+    ):
+        """Test each limit trips the breaker on its own."""
+        assert (
+            RiskLimits.should_stop_trading(
+                current_value,
+                peak_value,
+                0.10,
+                trades,
+                daily_pnl,
+                current_value,
+                0.01,
+            )
+            is expected
+        )
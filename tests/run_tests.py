@@ -9,10 +9,28 @@ import sys
 import os
 import subprocess
 import argparse
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
+# Test category -> directory under tests/ ("" runs everything)
+CATEGORY_DIRS = {
+    "all": "",
+    "core": "core",
+    "sell_put": "sell_put",
+    "covered_call": "covered_call",
+}
 
-def run_tests_with_pytest(test_path, verbose=False, coverage=False):
+# pytest-xdist scheduling modes: loadfile keeps each test module on one worker,
+# loadscope keeps each module or test class together, loadgroup spreads tests
+# like load but keeps each xdist_group together, load spreads individual tests
+# across workers
+DIST_MODES = ("loadfile", "loadscope", "loadgroup", "load")
+
+
+def run_tests_with_pytest(
+    test_path, verbose=False, coverage=False, workers="auto", dist_mode="loadfile"
+):
     """
     Run tests using pytest.
 
@@ -20,6 +38,9 @@ def run_tests_with_pytest(test_path, verbose=False, coverage=False):
         test_path: Path to test directory or file
         verbose: Whether to run in verbose mode
         coverage: Whether to run with coverage
+        workers: Number of pytest-xdist workers ("auto" for one per CPU core);
+            ignored when pytest-xdist is not installed
+        dist_mode: pytest-xdist scheduling mode (see DIST_MODES)
     """
     cmd = ["python", "-m", "pytest"]
 
@@ -29,20 +50,35 @@ def run_tests_with_pytest(test_path, verbose=False, coverage=False):
     if coverage:
         cmd.extend(["--cov=.", "--cov-report=term-missing", "--cov-report=html"])
 
+    if workers and find_spec("xdist") is not None:
+        # Workers sharing .pytest_cache would only contend on it
+        cmd.extend(["-n", str(workers), "--dist", dist_mode, "-p", "no:cacheprovider"])
+
     cmd.append(str(test_path))
 
     print(f"Running: {' '.join(cmd)}")
     print("-" * 80)
 
     try:
-        result = subprocess.run(cmd, capture_output=False, text=True)
+        import pytest
+    except ImportError:
+        pytest = None
+
+    try:
+        if pytest is not None:
+            # Run in this interpreter rather than paying for a second start-up
+            return pytest.main(cmd[3:]) == 0
+
+        result = subprocess.run(cmd)
         return result.returncode == 0
     except Exception as e:
         print(f"Error running tests: {e}")
         return False
 
 
-def run_specific_test_category(category, verbose=False, coverage=False):
+def run_specific_test_category(
+    category, verbose=False, coverage=False, workers="auto", dist_mode="loadfile"
+):
     """
     Run tests for a specific category.
 
@@ -50,32 +86,42 @@ def run_specific_test_category(category, verbose=False, coverage=False):
         category: Test category ('core', 'sell_put', 'covered_call', 'all')
         verbose: Whether to run in verbose mode
         coverage: Whether to run with coverage
+        workers: Number of pytest-xdist workers
+        dist_mode: pytest-xdist scheduling mode
     """
-    test_dir = Path(__file__).parent
-
-    if category == "all":
-        return run_tests_with_pytest(test_dir, verbose, coverage)
-    elif category == "core":
-        return run_tests_with_pytest(test_dir / "core", verbose, coverage)
-    elif category == "sell_put":
-        return run_tests_with_pytest(test_dir / "sell_put", verbose, coverage)
-    elif category == "covered_call":
-        return run_tests_with_pytest(test_dir / "covered_call", verbose, coverage)
-    else:
+    subdir = CATEGORY_DIRS.get(category)
+    if subdir is None:
         print(f"Unknown test category: {category}")
         return False
 
+    test_dir = Path(__file__).parent / subdir
+    return run_tests_with_pytest(test_dir, verbose, coverage, workers, dist_mode)
 
-def list_test_files():
-    """List all test files in the project."""
-    test_dir = Path(__file__).parent
+
+@lru_cache(maxsize=None)
+def _scan_test_files(root, prefix=""):
+    """
+    Recursively collect test_*.py files under root with os.scandir.
+
+    Paths are returned relative to the top-level root. The result is cached
+    for the life of the process, which for this script is a single run.
+    """
     test_files = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                test_files.extend(
+                    _scan_test_files(entry.path, f"{prefix}{entry.name}{os.sep}")
+                )
+            elif entry.name.startswith("test_") and entry.name.endswith(".py"):
+                test_files.append(f"{prefix}{entry.name}")
+    return tuple(test_files)
 
-    for test_file in test_dir.rglob("test_*.py"):
-        relative_path = test_file.relative_to(test_dir)
-        test_files.append(str(relative_path))
 
-    return sorted(test_files)
+def list_test_files():
+    """List all test files in the project."""
+    test_dir = Path(__file__).parent
+    return sorted(_scan_test_files(str(test_dir)))
 
 
 def main():
@@ -85,7 +131,7 @@ def main():
         "category",
         nargs="?",
         default="all",
-        choices=["all", "core", "sell_put", "covered_call"],
+        choices=tuple(CATEGORY_DIRS),
         help="Test category to run (default: all)",
     )
     parser.add_argument(
@@ -95,6 +141,19 @@ def main():
         "-c", "--coverage", action="store_true", help="Run tests with coverage report"
     )
     parser.add_argument("-l", "--list", action="store_true", help="List all test files")
+    parser.add_argument(
+        "-n",
+        "--workers",
+        default=os.environ.get("PYTEST_WORKERS", "auto"),
+        help="Number of parallel pytest-xdist workers, or 'auto' for one per CPU "
+        "core; 0 runs serially (default: $PYTEST_WORKERS or auto)",
+    )
+    parser.add_argument(
+        "--dist-mode",
+        default="loadfile",
+        choices=DIST_MODES,
+        help="How pytest-xdist groups tests onto workers (default: loadfile)",
+    )
 
     args = parser.parse_args()
 
@@ -108,9 +167,12 @@ def main():
     print(f"Running tests for category: {args.category}")
     print(f"Verbose: {args.verbose}")
     print(f"Coverage: {args.coverage}")
+    print(f"Workers: {args.workers} ({args.dist_mode})")
     print()
 
-    success = run_specific_test_category(args.category, args.verbose, args.coverage)
+    success = run_specific_test_category(
+        args.category, args.verbose, args.coverage, args.workers, args.dist_mode
+    )
 
     if success:
         print("\n✅ All tests passed!")
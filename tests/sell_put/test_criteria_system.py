@@ -5,8 +5,7 @@ This test verifies that the criteria system works correctly for different
 strategies and can be easily extended.
 """
 
-import unittest
-from unittest.mock import Mock
+import pytest
 from shared.utils.trading_criteria import (
     CriteriaManager,
     CriteriaPresets,
@@ -17,229 +16,354 @@ from shared.utils.trading_criteria import (
     RSICriterion,
     TrendCriterion,
     CriteriaResult,
+    CriteriaEvaluation,
+    TradingContext,
+    TradingCriterion,
 )
 
+# Keep the module on one worker under --dist loadgroup so the module-scoped
+# fixtures are built once
+pytestmark = pytest.mark.xdist_group("criteria")
 
-class TestCriteriaSystem(unittest.TestCase):
-    """Test the modular criteria system."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        pass
-
-    def test_delta_criterion(self):
-        """Test delta criterion evaluation."""
-        criterion = DeltaCriterion(target_range=(0.25, 0.75))
-        
-        # Test good delta
-        result = criterion.evaluate({'delta': 0.5})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertGreater(result.score, 0.8)
-        
-        # Test delta too high
-        result = criterion.evaluate({'delta': 0.8})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-        
-        # Test delta too low
-        result = criterion.evaluate({'delta': 0.1})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_market_regime_criterion(self):
-        """Test market regime criterion evaluation."""
-        criterion = MarketRegimeCriterion(allowed_regimes=['bullish_low_vol', 'neutral_normal_vol'])
-        
-        # Test allowed regime
-        result = criterion.evaluate({'market_regime': 'bullish_low_vol'})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertEqual(result.score, 1.0)
-        
-        # Test disallowed regime
-        result = criterion.evaluate({'market_regime': 'bearish_high_vol'})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_volatility_criterion(self):
-        """Test volatility criterion evaluation."""
-        criterion = VolatilityCriterion(max_volatility=0.5)
-        
-        # Test low volatility
-        result = criterion.evaluate({'volatility': 0.2})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertGreater(result.score, 0.5)
-        
-        # Test high volatility
-        result = criterion.evaluate({'volatility': 0.6})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_dte_criterion(self):
-        """Test DTE criterion evaluation."""
-        criterion = DTECriterion(min_dte=14, max_dte=45)
-        
-        # Test good DTE
-        result = criterion.evaluate({'dte': 30})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertGreater(result.score, 0.8)
-        
-        # Test DTE too low
-        result = criterion.evaluate({'dte': 10})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-        
-        # Test DTE too high
-        result = criterion.evaluate({'dte': 60})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_rsi_criterion(self):
-        """Test RSI criterion evaluation."""
-        criterion = RSICriterion(oversold=30, overbought=70)
-        
-        # Test good RSI
-        result = criterion.evaluate({'rsi': 50})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertGreater(result.score, 0.8)
-        
-        # Test oversold RSI
-        result = criterion.evaluate({'rsi': 20})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-        
-        # Test overbought RSI
-        result = criterion.evaluate({'rsi': 80})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_trend_criterion(self):
-        """Test trend criterion evaluation."""
-        criterion = TrendCriterion(allowed_directions=['bullish', 'neutral'])
-        
-        # Test allowed trend
-        result = criterion.evaluate({'trend_direction': 'bullish', 'trend_strength': 0.7})
-        self.assertEqual(result.result, CriteriaResult.PASS)
-        self.assertEqual(result.score, 0.7)
-        
-        # Test disallowed trend
-        result = criterion.evaluate({'trend_direction': 'bearish', 'trend_strength': 0.8})
-        self.assertEqual(result.result, CriteriaResult.FAIL)
-        self.assertEqual(result.score, 0.0)
-
-    def test_criteria_manager_basic(self):
-        """Test basic criteria manager functionality."""
-        manager = CriteriaManager()
-        
-        # Test empty manager
-        should_trade, score, message = manager.should_trade({})
-        self.assertTrue(should_trade)
-        self.assertEqual(score, 1.0)
-        
-        # Add a criterion
-        manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75)))
-        
-        # Test with good delta
-        should_trade, score, message = manager.should_trade({'delta': 0.5})
-        self.assertTrue(should_trade)
-        self.assertGreater(score, 0.8)
-        
-        # Test with bad delta
-        should_trade, score, message = manager.should_trade({'delta': 0.1})
-        self.assertFalse(should_trade)
-        self.assertEqual(score, 0.0)
-
-    def test_criteria_manager_multiple_criteria(self):
-        """Test criteria manager with multiple criteria."""
-        manager = CriteriaManager()
-        manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75), weight=1.0))
-        manager.add_criterion(VolatilityCriterion(max_volatility=0.5, weight=0.5))
-        
-        # Test with all criteria passing
-        context = {'delta': 0.5, 'volatility': 0.3}
-        should_trade, score, message = manager.should_trade(context)
-        self.assertTrue(should_trade)
-        self.assertGreater(score, 0.7)
-        
-        # Test with one criterion failing
-        context = {'delta': 0.5, 'volatility': 0.6}
-        should_trade, score, message = manager.should_trade(context)
-        self.assertFalse(should_trade)
-        self.assertEqual(score, 0.0)
-
-    def test_criteria_presets(self):
-        """Test predefined criteria presets."""
-        # Test delta-only preset
-        delta_only = CriteriaPresets.delta_only()
-        should_trade, score, message = delta_only.should_trade({'delta': 0.5})
-        self.assertTrue(should_trade)
-        
-        # Test conservative preset
-        conservative = CriteriaPresets.conservative()
-        context = {
-            'delta': 0.4, 'dte': 30, 'market_regime': 'bullish_low_vol',
-            'volatility': 0.2
-        }
-        should_trade, score, message = conservative.should_trade(context)
-        self.assertTrue(should_trade)
-        
-        # Test aggressive preset
-        aggressive = CriteriaPresets.aggressive()
-        context = {'delta': 0.5, 'volatility': 0.4}
-        should_trade, score, message = aggressive.should_trade(context)
-        self.assertTrue(should_trade)
-        
-        # Test momentum-based preset
-        momentum = CriteriaPresets.momentum_based()
-        context = {
-            'delta': 0.5, 'rsi': 60, 'trend_direction': 'bullish'
-        }
-        should_trade, score, message = momentum.should_trade(context)
-        self.assertTrue(should_trade)
-
-    def test_criteria_manager_remove_criterion(self):
-        """Test removing criteria from manager."""
-        manager = CriteriaManager()
-        manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75)))
-        manager.add_criterion(VolatilityCriterion(max_volatility=0.5))
-        
-        # Verify both criteria are present
-        self.assertEqual(len(manager.criteria), 2)
-        
-        # Remove volatility criterion
-        manager.remove_criterion("Volatility")
-        self.assertEqual(len(manager.criteria), 1)
-        self.assertEqual(manager.criteria[0].name, "Delta")
-        
-        # Test that only delta criterion is evaluated
-        context = {'delta': 0.5, 'volatility': 0.6}
-        should_trade, score, message = manager.should_trade(context)
-        self.assertTrue(should_trade)  # Should pass because volatility criterion was removed
-
-    def test_criteria_manager_weighted_scoring(self):
-        """Test weighted scoring in criteria manager."""
-        manager = CriteriaManager()
-        manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75), weight=2.0))
-        manager.add_criterion(VolatilityCriterion(max_volatility=0.5, weight=1.0))
-        
-        # Test with both criteria passing but different scores
-        context = {'delta': 0.5, 'volatility': 0.4}
-        should_trade, score, message = manager.should_trade(context)
-        self.assertTrue(should_trade)
-        
-        # The weighted score should be: (delta_score * 2 + vol_score * 1) / 3
-        # where delta_score and vol_score are both high since both criteria pass
-
-    def test_criteria_evaluation_details(self):
-        """Test that criteria evaluation provides detailed information."""
-        criterion = DeltaCriterion(target_range=(0.25, 0.75))
-        result = criterion.evaluate({'delta': 0.5})
-        
-        self.assertIsNotNone(result.details)
-        self.assertIn('delta', result.details)
-        self.assertIn('target_range', result.details)
-        self.assertEqual(result.details['delta'], 0.5)
-        self.assertEqual(result.details['target_range'], (0.25, 0.75))
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+
+@pytest.fixture(scope="module")
+def delta_criterion():
+    """Delta criterion with a (0.25, 0.75) range; tests only read it."""
+    return DeltaCriterion(target_range=(0.25, 0.75))
+
+
+@pytest.fixture(scope="module")
+def presets():
+    """The predefined criteria managers, keyed by preset name; tests only read them."""
+    return {
+        "delta_only": CriteriaPresets.delta_only(),
+        "conservative": CriteriaPresets.conservative(),
+        "aggressive": CriteriaPresets.aggressive(),
+        "momentum_based": CriteriaPresets.momentum_based(),
+    }
+
+
+@pytest.mark.parametrize(
+    "delta,expected",
+    [
+        (0.5, CriteriaResult.PASS),  # good delta
+        (0.8, CriteriaResult.FAIL),  # delta too high
+        (0.1, CriteriaResult.FAIL),  # delta too low
+    ],
+)
+def test_delta_criterion(delta_criterion, delta, expected):
+    """Test delta criterion evaluation."""
+    result = delta_criterion.evaluate({'delta': delta})
+    assert result.result == expected
+    if expected == CriteriaResult.PASS:
+        assert result.score > 0.8
+    else:
+        assert result.score == 0.0
+
+
+def test_market_regime_criterion():
+    """Test market regime criterion evaluation."""
+    criterion = MarketRegimeCriterion(allowed_regimes=['bullish_low_vol', 'neutral_normal_vol'])
+    
+    # Test allowed regime
+    result = criterion.evaluate({'market_regime': 'bullish_low_vol'})
+    assert result.result == CriteriaResult.PASS
+    assert result.score == 1.0
+    
+    # Test disallowed regime
+    result = criterion.evaluate({'market_regime': 'bearish_high_vol'})
+    assert result.result == CriteriaResult.FAIL
+    assert result.score == 0.0
+
+
+def test_volatility_criterion():
+    """Test volatility criterion evaluation."""
+    criterion = VolatilityCriterion(max_volatility=0.5)
+    
+    # Test low volatility
+    result = criterion.evaluate({'volatility': 0.2})
+    assert result.result == CriteriaResult.PASS
+    assert result.score > 0.5
+    
+    # Test high volatility
+    result = criterion.evaluate({'volatility': 0.6})
+    assert result.result == CriteriaResult.FAIL
+    assert result.score == 0.0
+
+
+@pytest.mark.parametrize(
+    "dte,expected",
+    [
+        (30, CriteriaResult.PASS),  # good DTE
+        (10, CriteriaResult.FAIL),  # DTE too low
+        (60, CriteriaResult.FAIL),  # DTE too high
+    ],
+)
+def test_dte_criterion(dte, expected):
+    """Test DTE criterion evaluation."""
+    criterion = DTECriterion(min_dte=14, max_dte=45)
+    result = criterion.evaluate({'dte': dte})
+    assert result.result == expected
+    if expected == CriteriaResult.PASS:
+        assert result.score > 0.8
+    else:
+        assert result.score == 0.0
+
+
+@pytest.mark.parametrize(
+    "rsi,expected",
+    [
+        (50, CriteriaResult.PASS),  # good RSI
+        (20, CriteriaResult.FAIL),  # oversold RSI
+        (80, CriteriaResult.FAIL),  # overbought RSI
+    ],
+)
+def test_rsi_criterion(rsi, expected):
+    """Test RSI criterion evaluation."""
+    criterion = RSICriterion(oversold=30, overbought=70)
+    result = criterion.evaluate({'rsi': rsi})
+    assert result.result == expected
+    if expected == CriteriaResult.PASS:
+        assert result.score > 0.8
+    else:
+        assert result.score == 0.0
+
+
+def test_trend_criterion():
+    """Test trend criterion evaluation."""
+    criterion = TrendCriterion(allowed_directions=['bullish', 'neutral'])
+    
+    # Test allowed trend
+    result = criterion.evaluate({'trend_direction': 'bullish', 'trend_strength': 0.7})
+    assert result.result == CriteriaResult.PASS
+    assert result.score == 0.7
+    
+    # Test disallowed trend
+    result = criterion.evaluate({'trend_direction': 'bearish', 'trend_strength': 0.8})
+    assert result.result == CriteriaResult.FAIL
+    assert result.score == 0.0
+
+
+def test_criteria_manager_basic():
+    """Test basic criteria manager functionality."""
+    manager = CriteriaManager()
+    
+    # Test empty manager
+    should_trade, score, message = manager.should_trade({})
+    assert should_trade
+    assert score == 1.0
+    
+    # Add a criterion
+    manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75)))
+    
+    # Test with good delta
+    should_trade, score, message = manager.should_trade({'delta': 0.5})
+    assert should_trade
+    assert score > 0.8
+    
+    # Test with bad delta
+    should_trade, score, message = manager.should_trade({'delta': 0.1})
+    assert not should_trade
+    assert score == 0.0
+
+
+def test_criteria_manager_multiple_criteria():
+    """Test criteria manager with multiple criteria."""
+    manager = CriteriaManager()
+    manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75), weight=1.0))
+    manager.add_criterion(VolatilityCriterion(max_volatility=0.5, weight=0.5))
+    
+    # Test with all criteria passing
+    context = {'delta': 0.5, 'volatility': 0.3}
+    should_trade, score, message = manager.should_trade(context)
+    assert should_trade
+    assert score > 0.7
+    
+    # Test with one criterion failing
+    context = {'delta': 0.5, 'volatility': 0.6}
+    should_trade, score, message = manager.should_trade(context)
+    assert not should_trade
+    assert score == 0.0
+
+
+def test_criteria_presets(presets):
+    """Test predefined criteria presets."""
+    # Test delta-only preset
+    should_trade, score, message = presets["delta_only"].should_trade({'delta': 0.5})
+    assert should_trade
+    
+    # Test conservative preset
+    context = {
+        'delta': 0.4, 'dte': 30, 'market_regime': 'bullish_low_vol',
+        'volatility': 0.2
+    }
+    should_trade, score, message = presets["conservative"].should_trade(context)
+    assert should_trade
+    
+    # Test aggressive preset
+    context = {'delta': 0.5, 'volatility': 0.4}
+    should_trade, score, message = presets["aggressive"].should_trade(context)
+    assert should_trade
+    
+    # Test momentum-based preset
+    context = {
+        'delta': 0.5, 'rsi': 60, 'trend_direction': 'bullish'
+    }
+    should_trade, score, message = presets["momentum_based"].should_trade(context)
+    assert should_trade
+
+
+def test_criteria_manager_remove_criterion():
+    """Test removing criteria from manager."""
+    manager = CriteriaManager()
+    manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75)))
+    manager.add_criterion(VolatilityCriterion(max_volatility=0.5))
+    
+    # Verify both criteria are present
+    assert len(manager.criteria) == 2
+    
+    # Remove volatility criterion
+    manager.remove_criterion("Volatility")
+    assert len(manager.criteria) == 1
+    assert manager.criteria[0].name == "Delta"
+    
+    # Test that only delta criterion is evaluated
+    context = {'delta': 0.5, 'volatility': 0.6}
+    should_trade, score, message = manager.should_trade(context)
+    assert should_trade  # Should pass because volatility criterion was removed
+
+
+def test_criteria_manager_weighted_scoring():
+    """Test weighted scoring in criteria manager."""
+    manager = CriteriaManager()
+    manager.add_criterion(DeltaCriterion(target_range=(0.25, 0.75), weight=2.0))
+    manager.add_criterion(VolatilityCriterion(max_volatility=0.5, weight=1.0))
+    
+    # Test with both criteria passing but different scores
+    context = {'delta': 0.5, 'volatility': 0.4}
+    should_trade, score, message = manager.should_trade(context)
+    assert should_trade
+    
+    # The weighted score should be: (delta_score * 2 + vol_score * 1) / 3
+    # where delta_score and vol_score are both high since both criteria pass
+
+
+def test_criteria_evaluation_details(delta_criterion):
+    """Test that criteria evaluation provides detailed information."""
+    criterion = delta_criterion
+    result = criterion.evaluate({'delta': 0.5})
+    
+    assert result.details is not None
+    assert 'delta' in result.details
+    assert 'target_range' in result.details
+    assert result.details['delta'] == 0.5
+    assert result.details['target_range'] == (0.25, 0.75)
+
+
+def _valid_context(**overrides):
+    """A TradingContext that passes validation (strike included)."""
+    values = dict(
+        delta=0.5,
+        dte=30,
+        strike=145.0,
+        underlying_price=150.0,
+        volatility=0.2,
+        market_regime='bullish_low_vol',
+        rsi=50.0,
+        trend_direction='bullish',
+        trend_strength=0.7,
+    )
+    values.update(overrides)
+    return TradingContext(**values)
+
+
+class _SpyCriterion(TradingCriterion):
+    """Criterion with a fixed outcome that counts how often it is evaluated."""
+
+    def __init__(self, name, result, score, weight=1.0):
+        super().__init__(name, weight)
+        self.result = result
+        self.score = score
+        self.calls = 0
+
+    def evaluate(self, context):
+        self.calls += 1
+        return CriteriaEvaluation(
+            criterion_name=self.name,
+            result=self.result,
+            score=self.score,
+            message=f"{self.name} {self.result.value}",
+            details={},
+        )
+
+
+def test_should_trade_stops_at_first_failure():
+    """Test that the first failing criterion blocks the trade on its own."""
+    failing = _SpyCriterion("First", CriteriaResult.FAIL, 0.0)
+    second = _SpyCriterion("Second", CriteriaResult.PASS, 1.0)
+    manager = CriteriaManager([failing, second])
+
+    result = manager.should_trade(_valid_context())
+
+    assert result == (False, 0.0, "Trade blocked by: First fail")
+    assert failing.calls == 1
+    assert second.calls == 0
+
+
+def test_should_trade_weighted_score():
+    """Test the weighted score when every criterion passes."""
+    # Same name on purpose: each result is weighted by its own criterion
+    heavy = _SpyCriterion("Spy", CriteriaResult.PASS, 0.8, weight=2.0)
+    light = _SpyCriterion("Spy", CriteriaResult.PASS, 0.5, weight=1.0)
+    manager = CriteriaManager([heavy, light])
+
+    should_trade, score, message = manager.should_trade(_valid_context())
+
+    assert should_trade
+    assert score == pytest.approx((0.8 * 2.0 + 0.5 * 1.0) / 3.0)
+    assert message == "Trade allowed by 2 criteria with score 0.700"
+
+
+def test_criteria_presets_return_independent_managers():
+    """Test that editing one preset manager leaves later ones untouched."""
+    edited = CriteriaPresets.conservative()
+    edited.remove_criterion("Volatility")
+    edited.add_criterion(RSICriterion())
+
+    fresh = CriteriaPresets.conservative()
+
+    assert [c.name for c in fresh.criteria] == [
+        "Delta", "MarketRegime", "Volatility", "DTE"
+    ]
+
+
+def test_criteria_presets_do_not_share_criterion_state():
+    """Test that tuning a preset's criterion leaves other managers untouched."""
+    edited = CriteriaPresets.conservative()
+    other = CriteriaPresets.conservative()
+
+    edited.criteria[0].weight = 5.0
+    edited.criteria[0].target_range = (0.4, 0.5)
+
+    for manager in (other, CriteriaPresets.conservative()):
+        delta = manager.criteria[0]
+        assert delta is not edited.criteria[0]
+        assert delta.weight == 1.0
+        assert delta.target_range == (0.2, 0.6)
+
+
+@pytest.mark.parametrize(
+    "preset",
+    [
+        CriteriaPresets.delta_only,
+        CriteriaPresets.conservative,
+        CriteriaPresets.aggressive,
+        CriteriaPresets.momentum_based,
+    ],
+    ids=["delta_only", "conservative", "aggressive", "momentum_based"],
+)
+def test_criteria_presets_allow_valid_context(preset):
+    """Test that every preset allows a trade on a valid, in-range context."""
+    should_trade, score, message = preset().should_trade(_valid_context())
+    assert should_trade, message
+    assert score > 0.0
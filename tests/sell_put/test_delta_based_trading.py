@@ -5,134 +5,240 @@ This test verifies that the simplified trading logic focuses on delta
 rather than complex market analysis.
 """
 
-import unittest
-from unittest.mock import Mock, MagicMock
-from datetime import date, timedelta
-from strategies.sell_put.components.market_analyzer import MarketAnalyzer
-from strategies.sell_put.components.position_manager import PositionManager
-from strategies.sell_put.components.data_handler import DataHandler
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from datetime import date
+from types import SimpleNamespace
+from strategies.sell_put.components.market_analyzer import (
+    MarketAnalyzer,
+    SUPPORT_RESISTANCE_WINDOW,
+)
 from shared.utils.option_utils import OptionContractSelector
-from shared.utils.market_analysis_types import MarketRegime, MarketAnalysis
-
-
-class TestDeltaBasedTrading(unittest.TestCase):
-    """Test delta-based trading simplification."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock strategy
-        self.mock_strategy = Mock()
-        self.mock_strategy.Time = date(2023, 1, 15)
-        self.mock_strategy.Log = Mock()
-        
-        # Mock data handler
-        self.mock_data_handler = Mock(spec=DataHandler)
-        self.mock_data_handler.get_option_delta.return_value = -0.35
-        
-        # Create market analyzer
-        self.market_analyzer = MarketAnalyzer(
-            strategy=self.mock_strategy,
-            ticker="AAPL"
-        )
+from shared.utils.market_analysis_types import (
+    MarketRegime,
+    MarketAnalysis,
+    VolatilityData,
+)
 
-    def test_simplified_market_analysis(self):
-        """Test that market analysis is simplified to focus on delta."""
-        # Test market analysis with price data
-        analysis = self.market_analyzer.analyze_market_conditions(150.0)
-        
-        # Should always return True for should_trade if we have price data
-        self.assertTrue(analysis.should_trade)
-        
-        # Should use fixed delta range
-        self.assertEqual(analysis.recommended_delta_range, (0.25, 0.75))
-        
-        # Should use fixed DTE range
-        self.assertEqual(analysis.recommended_dte_range, (14, 45))
-
-    def test_simplified_delta_range(self):
-        """Test that delta range is always fixed regardless of market conditions."""
-        # Test with different market conditions
-        market_regime = MarketRegime.BULLISH_LOW_VOL
-        volatility_data = Mock()
-        volatility_data.regime = "high"
-        
-        delta_range = self.market_analyzer.get_optimal_delta_range(
-            market_regime, volatility_data
-        )
-        
-        # Should always return fixed range
-        self.assertEqual(delta_range, (0.25, 0.75))
-
-    def test_simplified_dte_range(self):
-        """Test that DTE range is always fixed regardless of volatility."""
-        # Test with different volatility conditions
-        volatility_data = Mock()
-        volatility_data.regime = "high"
-        
-        dte_range = self.market_analyzer.get_optimal_dte_range(volatility_data)
-        
-        # Should always return fixed range
-        self.assertEqual(dte_range, (14, 45))
-
-    def test_simplified_should_trade(self):
-        """Test that should_trade is simplified."""
-        volatility_data = Mock()
-        volatility_data.regime = "high"
-        volatility_data.current = 0.6  # High volatility
-        
-        market_regime = MarketRegime.BEARISH_HIGH_VOL  # Bearish market
-        
-        # Should always return True regardless of market conditions
-        should_trade = self.market_analyzer._should_trade(volatility_data, market_regime)
-        self.assertTrue(should_trade)
-
-    def test_delta_based_contract_selection(self):
-        """Test that contract selection focuses on delta."""
-        # Mock contracts with different deltas
-        contracts = []
-        for i, delta in enumerate([0.2, 0.35, 0.5, 0.65, 0.8]):
-            contract = Mock()
-            contract.Symbol.Value = f"AAPL230120P{i*10}"
-            contract.Strike = 150 + i * 5
-            contract.Expiry = date(2023, 2, 17)
-            contracts.append(contract)
-        
-        # Mock underlying price
-        underlying_price = 150.0
-        
-        # Mock market analysis (simplified)
-        market_analysis = MarketAnalysis(
-            market_regime=MarketRegime.NEUTRAL_NORMAL_VOL,
-            underlying_price=underlying_price,
-            trend=Mock(),
-            volatility=Mock(),
-            support_resistance=Mock(),
-            rsi=50.0,
-            risk_score=0.5,
-            confidence_score=1.0,
-            should_trade=True,
-            recommended_delta_range=(0.25, 0.75),
-            recommended_dte_range=(14, 45),
-            analysis_timestamp="2023-01-15",
-            data_quality_score=1.0,
-        )
-        
-        # Test contract selection
-        target_delta_range = (0.25, 0.75)
-        
-        selected = OptionContractSelector.select_best_contract(
-            contracts,
-            underlying_price,
-            market_analysis,
-            target_delta_range,
-            lambda c: -0.35 if c.Strike == 155 else -0.5  # Mock delta function
+# Strategy attributes MarketAnalyzer touches
+STRATEGY_SPEC = ["Time", "Log"]
+
+
+def _reference_rsi(prices, period):
+    """Simple-average RSI over the last `period` price changes."""
+    changes = np.diff(prices)[-period:]
+    gains = changes[changes > 0].sum()
+    losses = -changes[changes < 0].sum()
+    if losses == 0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + gains / losses)
+
+
+@pytest.fixture(scope="module")
+def mock_strategy():
+    """Mock strategy shared by every test."""
+    strategy = Mock(spec_set=STRATEGY_SPEC)
+    strategy.Time = date(2023, 1, 15)
+    strategy.Log = Mock()
+    return strategy
+
+
+@pytest.fixture(scope="module")
+def shared_analyzer(mock_strategy):
+    """Market analyzer for tests that never feed it prices."""
+    return MarketAnalyzer(strategy=mock_strategy, ticker="AAPL")
+
+
+@pytest.fixture
+def market_analyzer(mock_strategy):
+    """Fresh market analyzer for tests that feed it prices."""
+    return MarketAnalyzer(strategy=mock_strategy, ticker="AAPL")
+
+
+def test_simplified_market_analysis(market_analyzer):
+    """Test that market analysis is simplified to focus on delta."""
+    # Test market analysis with price data
+    analysis = market_analyzer.analyze_market_conditions(150.0)
+
+    # Should always return True for should_trade if we have price data
+    assert analysis.should_trade
+
+    # Should use fixed delta range
+    assert analysis.recommended_delta_range == (0.25, 0.75)
+
+    # Should use fixed DTE range
+    assert analysis.recommended_dte_range == (14, 45)
+
+
+def test_simplified_delta_range(shared_analyzer):
+    """Test that delta range is always fixed regardless of market conditions."""
+    # Test with different market conditions
+    market_regime = MarketRegime.BULLISH_LOW_VOL
+    volatility_data = VolatilityData(
+        current=0.4, historical_vol=0.2, percentile=0.9, regime="high"
+    )
+
+    delta_range = shared_analyzer.get_optimal_delta_range(
+        market_regime, volatility_data
+    )
+
+    # Should always return fixed range
+    assert delta_range == (0.25, 0.75)
+
+
+def test_simplified_dte_range(shared_analyzer):
+    """Test that DTE range is always fixed regardless of volatility."""
+    # Test with different volatility conditions
+    volatility_data = VolatilityData(
+        current=0.4, historical_vol=0.2, percentile=0.9, regime="high"
+    )
+
+    dte_range = shared_analyzer.get_optimal_dte_range(volatility_data)
+
+    # Should always return fixed range
+    assert dte_range == (14, 45)
+
+
+def test_simplified_should_trade(shared_analyzer):
+    """Test that should_trade is simplified."""
+    volatility_data = VolatilityData(
+        current=0.6,  # High volatility
+        historical_vol=0.2,
+        percentile=0.9,
+        regime="high",
+    )
+
+    market_regime = MarketRegime.BEARISH_HIGH_VOL  # Bearish market
+
+    # Should always return True regardless of market conditions
+    should_trade = shared_analyzer._should_trade(volatility_data, market_regime)
+    assert should_trade
+
+
+def test_delta_based_contract_selection():
+    """Test that contract selection focuses on delta."""
+    # Stub contracts with different deltas; the selector only reads
+    # Symbol.Value, Strike and Expiry
+    contracts = [
+        SimpleNamespace(
+            Symbol=SimpleNamespace(Value=f"AAPL230120P{i*10}"),
+            Strike=150 + i * 5,
+            Expiry=date(2023, 2, 17),
         )
-        
-        # Should select a contract (the one with delta 0.35)
-        self.assertIsNotNone(selected)
-        if selected:
-            self.assertEqual(selected.Strike, 155)
+        for i, delta in enumerate([0.2, 0.35, 0.5, 0.65, 0.8])
+    ]
+
+    # Mock underlying price
+    underlying_price = 150.0
+
+    # Mock market analysis (simplified)
+    market_analysis = MarketAnalysis(
+        market_regime=MarketRegime.NEUTRAL_NORMAL_VOL,
+        underlying_price=underlying_price,
+        trend=Mock(),
+        volatility=Mock(),
+        support_resistance=Mock(),
+        rsi=50.0,
+        risk_score=0.5,
+        confidence_score=1.0,
+        should_trade=True,
+        recommended_delta_range=(0.25, 0.75),
+        recommended_dte_range=(14, 45),
+        analysis_timestamp="2023-01-15",
+        data_quality_score=1.0,
+    )
+
+    # Test contract selection
+    target_delta_range = (0.25, 0.75)
+
+    selected = OptionContractSelector.select_best_contract(
+        contracts,
+        underlying_price,
+        market_analysis,
+        target_delta_range,
+        lambda c: -0.35 if c.Strike == 155 else -0.5  # Mock delta function
+    )
+
+    # Should select a contract (the one with delta 0.35)
+    assert selected is not None
+    if selected:
+        assert selected.Strike == 155
+
+
+def test_load_price_history_matches_streaming(market_analyzer, mock_strategy):
+    """Test that bulk-loading prices matches updating one at a time."""
+    prices = np.linspace(100.0, 130.0, 47)
+    streamed = MarketAnalyzer(strategy=mock_strategy, ticker="AAPL")
+    for price in prices:
+        streamed.update_price_history(price)
+
+    market_analyzer.load_price_history(prices)
+
+    np.testing.assert_array_equal(
+        market_analyzer.price_history, streamed.price_history
+    )
+
+    # Streaming on top of a bulk load keeps the window contiguous
+    market_analyzer.update_price_history(131.0)
+    streamed.update_price_history(131.0)
+    np.testing.assert_array_equal(
+        market_analyzer.price_history, streamed.price_history
+    )
+
+
+def test_running_rsi_matches_full_recalculation(market_analyzer):
+    """Test that the streaming RSI agrees with recomputing it from prices."""
+    prices = 150.0 + 5.0 * np.sin(np.linspace(0.0, 12.0, 80))
+    for price in prices:
+        market_analyzer.update_price_history(price)
+        window = market_analyzer.price_history
+        if len(window) > market_analyzer.rsi_period:
+            assert market_analyzer._calculate_rsi() == pytest.approx(
+                _reference_rsi(window, market_analyzer.rsi_period), abs=1e-7
+            )
+
+
+def test_market_analyzer_equality_ignores_internal_state(mock_strategy):
+    """Test that comparing analyzers skips the price buffer and caches."""
+    first = MarketAnalyzer(strategy=mock_strategy, ticker="AAPL")
+    second = MarketAnalyzer(strategy=mock_strategy, ticker="AAPL")
+    first.update_price_history(150.0)
+
+    # Separate criteria managers never compare equal, as before the buffer
+    assert first != second
+
+
+# Rounded swings plus a flat stretch: repeated highs/lows and extremes that
+# age out of the window
+TIED_PRICES = np.concatenate(
+    [np.round(150.0 + 5.0 * np.sin(np.linspace(0.0, 9.0, 50))), np.full(15, 152.0)]
+)
+
+
+def _assert_window_levels(analyzer, prices):
+    """Check support/resistance against min/max of the trailing window."""
+    levels = analyzer._analyze_support_resistance()
+    window = prices[-SUPPORT_RESISTANCE_WINDOW:]
+    assert levels.support_level == window.min()
+    assert levels.resistance_level == window.max()
+
+
+def test_support_resistance_tracks_window_extremes(market_analyzer):
+    """Test the streamed high/low deques against the trailing window."""
+    for i, price in enumerate(TIED_PRICES, start=1):
+        market_analyzer.update_price_history(price)
+        if i >= SUPPORT_RESISTANCE_WINDOW:
+            _assert_window_levels(market_analyzer, TIED_PRICES[:i])
+
+
+@pytest.mark.parametrize("loaded", [SUPPORT_RESISTANCE_WINDOW, 33, 50])
+def test_support_resistance_after_load_price_history(market_analyzer, loaded):
+    """Test the high/low deques rebuilt by a bulk load, then streamed on."""
+    market_analyzer.load_price_history(TIED_PRICES[:loaded])
+    _assert_window_levels(market_analyzer, TIED_PRICES[:loaded])
 
+    for i in range(loaded, len(TIED_PRICES)):
+        market_analyzer.update_price_history(TIED_PRICES[i])
+        _assert_window_levels(market_analyzer, TIED_PRICES[: i + 1])
 
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
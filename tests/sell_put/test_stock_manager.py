@@ -0,0 +1,36 @@
+"""
+Tests for StockManager's bounded price history.
+"""
+
+import pytest
+from unittest.mock import Mock
+from shared.utils.constants import MAX_PRICE_HISTORY_LENGTH
+from strategies.sell_put.components.stock_manager import StockManager
+
+
+@pytest.fixture
+def manager():
+    """Stock manager with default parameters."""
+    return StockManager(strategy=Mock(), ticker="AAPL", config={})
+
+
+def test_update_price_history_trims_oldest(manager):
+    """Test that streaming prices keeps only the most recent window."""
+    for price in range(MAX_PRICE_HISTORY_LENGTH + 10):
+        manager._update_price_history(float(price))
+
+    assert len(manager.price_history) == MAX_PRICE_HISTORY_LENGTH
+    assert manager.price_history[0] == 10.0
+    assert manager.price_history[-1] == MAX_PRICE_HISTORY_LENGTH + 9
+
+
+def test_extend_price_history_matches_streaming(manager):
+    """Test that a bulk extend keeps the same window as streaming."""
+    prices = [float(p) for p in range(MAX_PRICE_HISTORY_LENGTH + 10)]
+    streamed = StockManager(strategy=Mock(), ticker="AAPL", config={})
+    for price in prices:
+        streamed._update_price_history(price)
+
+    manager.extend_price_history(prices)
+
+    assert list(manager.price_history) == list(streamed.price_history)